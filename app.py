@@ -14,15 +14,18 @@ st.set_page_config(
 st.title("Jumia Review Intelligence Dashboard")
 st.caption("Hybrid AfriBERTa + Behavioural Analytics for Deceptive Review Detection")
 
-DATA_PATH = "data/processed/cleaned_labeled_reviews.csv"
+DATA_PATH = "data/processed/cleaned_labeled_reviews.parquet"
+LEGACY_DATA_PATH = "data/processed/cleaned_labeled_reviews.csv"
 METRICS_PATH = "data/models/metrics.json"
 
-if not os.path.exists(DATA_PATH):
+if os.path.exists(DATA_PATH):
+    df = pd.read_parquet(DATA_PATH)
+elif os.path.exists(LEGACY_DATA_PATH):
+    df = pd.read_csv(LEGACY_DATA_PATH)
+else:
     st.error("Processed dataset not found. Run preprocessor first.")
     st.stop()
 
-df = pd.read_csv(DATA_PATH)
-
 tab1, tab2, tab3 = st.tabs([
     "Overview",
     "Model Evaluation",
@@ -21,7 +21,10 @@ class FeatureEngineer:
 
     def load_encoder(self):
         self.tokenizer = AutoTokenizer.from_pretrained(self.afriberta_model_name)
-        self.encoder = AutoModel.from_pretrained(self.afriberta_model_name)
+        self.encoder = AutoModel.from_pretrained(
+            self.afriberta_model_name,
+            add_pooling_layer=False
+        )
 
     def create_tfidf(self, texts, max_features: int = 5000):
         vectorizer = TfidfVectorizer(
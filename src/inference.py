@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import joblib
 import numpy as np
 import torch
@@ -5,6 +7,35 @@ import torch
 from transformers import AutoTokenizer, AutoModel, pipeline
 
 
+@lru_cache(maxsize=1)
+def _load_classifiers():
+    return (
+        joblib.load("data/models/text_model.pkl"),
+        joblib.load("data/models/behaviour_model.pkl"),
+        joblib.load("data/models/scaler.pkl")
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_encoder(device: str):
+    tokenizer = AutoTokenizer.from_pretrained("castorini/afriberta_large")
+    encoder = AutoModel.from_pretrained(
+        "castorini/afriberta_large",
+        add_pooling_layer=False
+    )
+    encoder.to(device)
+    encoder.eval()
+    return tokenizer, encoder
+
+
+@lru_cache(maxsize=1)
+def _load_sentiment_pipe():
+    return pipeline(
+        "sentiment-analysis",
+        model="cardiffnlp/twitter-roberta-base-sentiment-latest"
+    )
+
+
 class HybridReviewInference:
     """
     Inference engine for the hybrid Jumia review intelligence system.
@@ -13,24 +44,17 @@ class HybridReviewInference:
     Text -> AfriBERTa embedding -> text classifier
     Behaviour features -> scaler -> behaviour classifier
     Late fusion -> final probability -> label
+
+    Models are loaded once per process and shared by every instance, so
+    creating an engine per request (as the dashboard does) stays cheap.
     """
 
     def __init__(self):
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
 
-        self.text_model = joblib.load("data/models/text_model.pkl")
-        self.behaviour_model = joblib.load("data/models/behaviour_model.pkl")
-        self.scaler = joblib.load("data/models/scaler.pkl")
-
-        self.tokenizer = AutoTokenizer.from_pretrained("castorini/afriberta_large")
-        self.encoder = AutoModel.from_pretrained("castorini/afriberta_large")
-        self.encoder.to(self.device)
-        self.encoder.eval()
-
-        self.sentiment_pipe = pipeline(
-            "sentiment-analysis",
-            model="cardiffnlp/twitter-roberta-base-sentiment-latest"
-        )
+        self.text_model, self.behaviour_model, self.scaler = _load_classifiers()
+        self.tokenizer, self.encoder = _load_encoder(self.device)
+        self.sentiment_pipe = _load_sentiment_pipe()
 
     def get_text_embedding(self, text: str) -> np.ndarray:
         with torch.no_grad():
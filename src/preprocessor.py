@@ -12,6 +12,13 @@ import numpy as np
 dotenv.load_dotenv()
 warnings.filterwarnings("ignore")
 
+_DIGITS_RE = re.compile(r"(\d+)")
+_URL_RE = re.compile(r"http\S+|www\S+")
+_HTML_TAG_RE = re.compile(r"<.*?>")
+_NON_WORD_RE = re.compile(r"[^\w\s']")
+_WHITESPACE_RE = re.compile(r"\s+")
+_REPEAT_RE = re.compile(r"(.)\1{2,}")
+
 
 class JumiaPreprocessor:
     """
@@ -64,8 +71,34 @@ class JumiaPreprocessor:
         "greeeaat": "great"
     }
 
+    # Whole-token alternation over the map keys, built once, so slang can be
+    # rewritten across a column without splitting every review into tokens.
+    PIDGIN_RE = re.compile(
+        r"(?<!\S)(?:"
+        + "|".join(sorted(map(re.escape, PIDGIN_MAP), key=len, reverse=True))
+        + r")(?!\S)"
+    )
+
     CRITICAL_NEGATORS = {"not", "no", "never", "dey", "nor", "nope", "hardly"}
 
+    VERIFIED_VALUES = {"true", "1", "yes", "verified purchase"}
+
+    RAW_COLUMNS: List[str] = [
+        "Category", "Product_Name", "Product_URL", "User_Name", "Rating",
+        "Review_Title", "Review_Text", "Timestamp", "Verified_Badge"
+    ]
+
+    # Free-text and raw scraped fields are parsed downstream, so keep them as
+    # strings instead of letting the CSV reader guess per file.
+    RAW_DTYPES: Dict[str, str] = {
+        "User_Name": "string",
+        "Rating": "string",
+        "Review_Title": "string",
+        "Review_Text": "string",
+        "Timestamp": "string",
+        "Verified_Badge": "string"
+    }
+
     def __init__(self, input_files: List[str]):
         self.input_files = input_files
         self.df: pd.DataFrame | None = None
@@ -77,14 +110,17 @@ class JumiaPreprocessor:
             if not os.path.exists(file):
                 print(f"[WARN] Missing file: {file}")
                 continue
-            temp = pd.read_csv(file)
+            header = pd.read_csv(file, nrows=0).columns
+            usecols = [col for col in self.RAW_COLUMNS if col in header]
+            temp = pd.read_csv(file, engine="pyarrow", usecols=usecols, dtype=self.RAW_DTYPES)
+            temp = temp.reindex(columns=self.RAW_COLUMNS)
             temp["Source_File"] = os.path.basename(file)
             frames.append(temp)
 
         if not frames:
             raise FileNotFoundError("No raw CSV files were found.")
 
-        self.df = pd.concat(frames, ignore_index=True)
+        self.df = pd.concat(frames, ignore_index=True, sort=False, copy=False)
         print(f"[INFO] Loaded {len(self.df)} raw records from {len(frames)} files.")
         return self.df
 
@@ -100,35 +136,18 @@ class JumiaPreprocessor:
         return df
 
     @staticmethod
-    def _parse_rating(x) -> int:
-        if pd.isna(x):
-            return 0
-        text = str(x)
-        match = re.search(r"(\d+)", text)
-        return int(match.group(1)) if match else 0
-
-    @staticmethod
-    def _to_bool(x) -> bool:
-        return str(x).strip().lower() in {"true", "1", "yes", "verified purchase"}
-
-    @staticmethod
-    def _strip_noise(text: str) -> str:
-        if not isinstance(text, str):
-            return ""
-        text = re.sub(r"http\S+|www\S+", " ", text)
-        text = re.sub(r"<.*?>", " ", text)
-        text = re.sub(r"[^\w\s']", " ", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
-
-    @staticmethod
-    def _reduce_repetitions(text: str) -> str:
-        return re.sub(r"(.)\1{2,}", r"\1", text)
-
-    def _normalize_pidgin(self, text: str) -> str:
-        tokens = text.split()
-        normalized = [self.PIDGIN_MAP.get(tok, tok) for tok in tokens]
-        return " ".join(normalized)
+    def _parse_timestamps(raw: pd.Series) -> pd.Series:
+        """
+        Jumia renders review dates as DD-MM-YYYY; parse that format directly and
+        only fall back to flexible day-first parsing for rows it misses.
+        """
+        parsed = pd.to_datetime(raw, format="%d-%m-%Y", errors="coerce", cache=True)
+        retry = parsed.isna() & raw.notna()
+        if retry.any():
+            parsed[retry] = pd.to_datetime(
+                raw[retry], format="mixed", dayfirst=True, errors="coerce", cache=True
+            )
+        return parsed
 
     @staticmethod
     def _derive_user_id(user_name: str, product_url: str) -> str:
@@ -139,10 +158,6 @@ class JumiaPreprocessor:
         base = f"{user_name}|{product_url.split('?')[0]}"
         return hashlib.md5(base.encode("utf-8")).hexdigest()[:12]
 
-    @staticmethod
-    def _compose_text(title: str, body: str) -> str:
-        return f"{str(title).strip()} {str(body).strip()}".strip()
-
     def clean_structure(self) -> pd.DataFrame:
         self.df = self._ensure_columns(self.df)
 
@@ -152,44 +167,68 @@ class JumiaPreprocessor:
         self.df["Category"] = self.df["Category"].fillna("Unknown").astype(str)
         self.df["Product_URL"] = self.df["Product_URL"].fillna("").astype(str)
 
-        self.df["Full_Review"] = self.df.apply(
-            lambda row: self._compose_text(row["Review_Title"], row["Review_Text"]), axis=1
-        )
+        self.df["Full_Review"] = (
+            self.df["Review_Title"].str.strip() + " " + self.df["Review_Text"].str.strip()
+        ).str.strip()
 
         before = len(self.df)
 
-        self.df = self.df[self.df["Full_Review"].str.strip() != ""].copy()
-        self.df.drop_duplicates(
-            subset=["Product_URL", "User_Name", "Review_Text", "Rating", "Timestamp"],
-            inplace=True
-        )
+        # Build one keep-mask (non-empty, first occurrence, parseable date) so
+        # the frame is sliced and copied once; each check only scans rows that
+        # survived the previous one.
+        dedupe_key = ["Product_URL", "User_Name", "Review_Text", "Rating", "Timestamp"]
+        keep = self.df["Full_Review"] != ""
+        keep[keep] = (~self.df.loc[keep, dedupe_key].duplicated()).to_numpy()
+
+        timestamps = self._parse_timestamps(self.df.loc[keep, "Timestamp"])
+        keep[keep] = timestamps.notna().to_numpy()
 
-        self.df["Rating"] = self.df["Rating"].apply(self._parse_rating)
-        self.df["Verified_Badge"] = self.df["Verified_Badge"].apply(self._to_bool)
-        self.df["Timestamp"] = pd.to_datetime(self.df["Timestamp"], errors="coerce", dayfirst=True)
+        self.df = self.df.loc[keep].reset_index(drop=True)
+        self.df["Timestamp"] = timestamps[timestamps.notna()].to_numpy()
+
+        # Star ratings only run 0-5; anything else is treated like a missing
+        # rating so the int8 cast can't wrap it.
+        rating = pd.to_numeric(
+            self.df["Rating"].astype(str).str.extract(_DIGITS_RE, expand=False), errors="coerce"
+        )
+        self.df["Rating"] = rating.where(rating.between(0, 5), 0).astype("int8")
+        self.df["Verified_Badge"] = (
+            self.df["Verified_Badge"].astype(str).str.strip().str.lower().isin(self.VERIFIED_VALUES)
+        )
 
         self.df["User_ID"] = self.df.apply(
             lambda row: self._derive_user_id(row["User_Name"], row["Product_URL"]), axis=1
         )
 
-        self.df = self.df[self.df["Timestamp"].notna()].copy()
+        # Only a handful of categories exist, so store them as category codes
+        # instead of per-row Python strings. User_Name is close to one value
+        # per reviewer and stays a plain string column.
+        self.df["Category"] = self.df["Category"].astype("category")
 
         after = len(self.df)
         print(f"[INFO] Structure cleanup complete. Removed {before - after} rows.")
         return self.df
 
     def normalize_texts(self) -> pd.DataFrame:
-        def normalize(text: str) -> str:
-            text = text.lower()
-            text = self._strip_noise(text)
-            text = self._reduce_repetitions(text)
-            text = self._normalize_pidgin(text)
-            text = re.sub(r"\s+", " ", text).strip()
-            return text
-
-        self.df["Cleaned_Text"] = self.df["Full_Review"].apply(normalize)
+        # Short boilerplate reviews ("Good product", "Nice") repeat heavily,
+        # so normalize each distinct text once and map the result back.
+        unique_reviews = self.df["Full_Review"].drop_duplicates()
+
+        # Each cleaning stage is one pass over the column, in this order:
+        # lowercase, strip URLs/tags/punctuation, collapse repeats, map slang.
+        texts = unique_reviews.str.lower()
+        texts = texts.str.replace(_URL_RE, " ", regex=True)
+        texts = texts.str.replace(_HTML_TAG_RE, " ", regex=True)
+        texts = texts.str.replace(_NON_WORD_RE, " ", regex=True)
+        texts = texts.str.replace(_WHITESPACE_RE, " ", regex=True).str.strip()
+        texts = texts.str.replace(_REPEAT_RE, r"\1", regex=True)
+        texts = texts.str.replace(self.PIDGIN_RE, lambda m: self.PIDGIN_MAP[m.group(0)], regex=True)
+        texts = texts.str.replace(_WHITESPACE_RE, " ", regex=True).str.strip()
+
+        cleaned = dict(zip(unique_reviews, texts))
+        self.df["Cleaned_Text"] = self.df["Full_Review"].map(cleaned)
         self.df["Text_Length"] = self.df["Cleaned_Text"].str.len()
-        self.df["Word_Count"] = self.df["Cleaned_Text"].str.split().apply(len)
+        self.df["Word_Count"] = self.df["Cleaned_Text"].str.count(r"\S+")
         return self.df
 
     def remove_near_duplicates(self, threshold: float = 0.95) -> pd.DataFrame:
@@ -197,7 +236,7 @@ class JumiaPreprocessor:
         Lightweight near-duplicate removal using normalized exact key.
         If you want heavier semantic duplicate removal, do that in features.py with cosine similarity.
         """
-        self.df["Near_Dupe_Key"] = self.df["Cleaned_Text"].str.replace(r"\s+", " ", regex=True)
+        self.df["Near_Dupe_Key"] = self.df["Cleaned_Text"].str.replace(_WHITESPACE_RE, " ", regex=True)
         before = len(self.df)
         self.df.drop_duplicates(subset=["Near_Dupe_Key"], inplace=True)
         after = len(self.df)
@@ -256,18 +295,30 @@ class JumiaPreprocessor:
         print(self.df["Deception_Label"].value_counts(dropna=False).to_dict())
         return self.df
 
-    def save_outputs(self) -> None:
+    def save_outputs(self, file_format: str = "parquet") -> None:
+        """
+        Parquet keeps dtypes (categories, datetimes, bools) and is much smaller
+        and faster to reload; pass file_format="csv" for legacy consumers.
+        """
+        if file_format not in {"parquet", "csv"}:
+            raise ValueError(f"Unsupported output format: {file_format}")
+
         os.makedirs("data/processed", exist_ok=True)
 
-        full_path = "data/processed/cleaned_labeled_reviews.csv"
-        train_path = "data/processed/trainable_reviews.csv"
+        full_path = f"data/processed/cleaned_labeled_reviews.{file_format}"
+        train_path = f"data/processed/trainable_reviews.{file_format}"
 
-        self.df.to_csv(full_path, index=False)
-        self.df[self.df["Deception_Label"].isin([0, 1])].to_csv(train_path, index=False)
+        trainable = self.df[self.df["Deception_Label"].isin([0, 1])]
+        if file_format == "parquet":
+            self.df.to_parquet(full_path, compression="zstd", index=False)
+            trainable.to_parquet(train_path, compression="zstd", index=False)
+        else:
+            self.df.to_csv(full_path, index=False)
+            trainable.to_csv(train_path, index=False)
 
         meta = {
             "total_rows": int(len(self.df)),
-            "trainable_rows": int(self.df["Deception_Label"].isin([0, 1]).sum()),
+            "trainable_rows": int(len(trainable)),
             "columns": list(self.df.columns)
         }
         with open("data/processed/preprocessing_metadata.json", "w", encoding="utf-8") as f:
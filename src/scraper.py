@@ -1,14 +1,25 @@
 import os
 import re
+import csv
 import time
 import random
 import logging
+import logging.handlers
+import queue
+import sqlite3
 import traceback
 import hashlib
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from urllib.parse import urljoin
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
 
-import pandas as pd
 import dotenv
-from bs4 import BeautifulSoup
+import requests
+import requests_cache
+import lxml.html
+from lxml import etree
 
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service
@@ -18,7 +29,6 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
     ElementClickInterceptedException,
     InvalidSessionIdException,
     WebDriverException,
@@ -27,6 +37,66 @@ from selenium.common.exceptions import (
 
 dotenv.load_dotenv()
 
+_log_listener = None
+_log_listener_pid = None
+
+
+def _configure_logging(log_path="logs/jumia_scraper.log"):
+    """
+    Routes records through a QueueHandler so callers only pay for an
+    enqueue; a QueueListener thread does the actual file writes. Set up
+    once per process, since a forked worker inherits the handler but not
+    the listener thread.
+    """
+    global _log_listener, _log_listener_pid
+    if _log_listener is not None and _log_listener_pid == os.getpid():
+        return
+
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    file_handler = logging.FileHandler(log_path, mode="a")
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s]: %(message)s")
+    )
+
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    # Selenium logs every WebDriver command at INFO/DEBUG.
+    logging.getLogger("selenium").setLevel(logging.WARNING)
+
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
+    _log_listener_pid = os.getpid()
+
+    # Lowest priority, so records logged by the scraper finalizers still
+    # drain before the listener stops.
+    Finalize(_log_listener, _log_listener.stop, exitpriority=0)
+
+
+@dataclass(slots=True)
+class Review:
+    """One scraped review; field order is the CSV column order."""
+    Category: str
+    Product_Name: str
+    Product_URL: str
+    User_Name: str
+    User_ID: str
+    Rating: int
+    Review_Title: str
+    Review_Text: str
+    Timestamp: str
+    Verified_Badge: bool
+
+
+REVIEW_FIELDS = tuple(f.name for f in fields(Review))
+
+# Flat row for csv.writer; dataclasses.astuple would deep-copy every value.
+_review_row = attrgetter(*REVIEW_FIELDS)
+
 
 class JumiaRetailScraper:
     """
@@ -36,7 +106,9 @@ class JumiaRetailScraper:
     - Namespace-Agnostic Pagination: Uses ARIA labels instead of SVG attributes.
     - SPA Awareness: Handles dynamic DOM updates and stale elements.
     - Anti-Bot Stealth: Uses CDP injection and randomized human-like delays.
-    - Robust I/O: Atomic write operations for CSV data safety.
+    - Robust I/O: Append-only, fsynced CSV writes per category.
+    - Parallel Sessions: Products are spread across worker processes,
+      each driving its own WebDriver session.
 
     Added for downstream ML pipeline:
     - Product_Name
@@ -45,20 +117,77 @@ class JumiaRetailScraper:
     - Output path aligned to data/raw/
     """
 
-    def __init__(self, driver_path, user_agent):
+    # Review fields are pulled with XPath compiled once per process; the
+    # class tests match whole class tokens, like BeautifulSoup's class_ filter.
+    _XP_ARTICLES = etree.XPath("//article")
+    _XP_STARS = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' stars ')]")
+    _XP_TITLE = etree.XPath(".//h3")
+    _XP_TEXT = etree.XPath(".//p[contains(concat(' ', normalize-space(@class), ' '), ' -pvs ')]")
+    _XP_META = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' -pvs ')]")
+    _XP_SPANS = etree.XPath(".//span")
+    _XP_NEXT_HREF = etree.XPath("//a[@aria-label='Next Page']/@href")
+    _XP_PAGE_TITLE = etree.XPath("normalize-space(//title)")
+    _XP_SEE_ALL_HREF = etree.XPath("//a[contains(., 'See All')]/@href")
+    _XP_VERIFIED = etree.XPath("boolean(.//text()[contains(., 'Verified Purchase')])")
+
+    # One parser per process, reused for every page; ids, comments and
+    # processing instructions are never queried, so libxml2 skips them.
+    _HTML_PARSER = lxml.html.HTMLParser(
+        collect_ids=False, remove_comments=True, remove_pis=True
+    )
+
+    _RATING_RE = re.compile(r"(\d+)")
+
+    # Plain HTTP has no CSS, so the Next link Jumia keeps hidden on the last
+    # page is still followed. Longer walks are left to the browser path.
+    MAX_HTTP_REVIEW_PAGES = 50
+
+    # Anything these raise means "use the browser": network failures and
+    # errors from the shared sqlite cache (e.g. "database is locked").
+    _HTTP_ERRORS = (requests.RequestException, sqlite3.Error, OSError)
+
+    _ARTICLES_HTML_JS = (
+        "Array.from(document.querySelectorAll('article'))"
+        ".map(a => a.outerHTML).join('')"
+    )
+
+    # Absolute URL of a visible Next Page link, or null on the last page.
+    _NEXT_PAGE_HREF_JS = (
+        "const a = document.querySelector(\"a[aria-label='Next Page']\");"
+        "return a && a.offsetParent !== null ? a.href : null;"
+    )
+
+    # WebDriver locators, built once. CSS is used wherever it can express the
+    # match; the cookie button still needs XPath for its text() fallback.
+    _LOC_POPUP_CLOSE = (By.CSS_SELECTOR, "button[aria-label*='close'], button[class*='cls']")
+    _LOC_COOKIE_ACCEPT = (
+        By.XPATH, "//button[@id='cookies-accept-all' or contains(text(), 'Accept')]"
+    )
+    _LOC_PRODUCT_CARD = (By.CSS_SELECTOR, ".prd")
+    _LOC_SEE_ALL = (By.PARTIAL_LINK_TEXT, "See All")
+    _LOC_ARTICLE = (By.TAG_NAME, "article")
+
+    # Heavy assets and trackers the HTML extraction never needs. Stylesheets
+    # stay allowed: pagination checks the Next link is actually rendered.
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+        "*.woff*", "*.ttf", "*.mp4",
+        "*googletagmanager*", "*google-analytics*", "*facebook*", "*doubleclick*"
+    ]
+
+    FIELDNAMES = list(REVIEW_FIELDS)
+
+    def __init__(self, driver_path, user_agent, block_assets=True):
         self.driver_path = driver_path
         self.user_agent = user_agent
-        self.results = []
+        self.block_assets = block_assets
+        self._writers = {}
+        self._http = None
+        self.products_scraped = 0
         self.browser = None
         self.wait = None
 
-        os.makedirs("logs", exist_ok=True)
-        logging.basicConfig(
-            filename="logs/jumia_scraper.log",
-            filemode="a",
-            level=logging.INFO,
-            format="%(asctime)s [%(levelname)s]: %(message)s"
-        )
+        _configure_logging()
         self.logger = logging.getLogger()
 
         self._init_browser()
@@ -86,8 +215,24 @@ class JumiaRetailScraper:
             edge_options.add_argument("--window-size=1920,1080")
             edge_options.add_argument("--disable-extensions")
 
+            prefs = {
+                "profile.default_content_setting_values.notifications": 2,
+                "profile.default_content_setting_values.geolocation": 2
+            }
+            if self.block_assets:
+                # Images are off from the first navigation, before the CDP
+                # URL blocklist below can take effect.
+                prefs["profile.managed_default_content_settings.images"] = 2
+                edge_options.add_argument("--blink-settings=imagesEnabled=false")
+            edge_options.add_experimental_option("prefs", prefs)
+
             service = Service(executable_path=self.driver_path, log_path=os.devnull)
-            self.browser = webdriver.Edge(service=service, options=edge_options)
+            # Reuse one pooled HTTP connection to msedgedriver for every command.
+            self.browser = webdriver.Edge(
+                service=service,
+                options=edge_options,
+                keep_alive=True
+            )
 
             self.browser.execute_cdp_cmd(
                 "Page.addScriptToEvaluateOnNewDocument",
@@ -99,17 +244,35 @@ class JumiaRetailScraper:
                 }
             )
 
+            if self.block_assets:
+                self.browser.execute_cdp_cmd("Network.enable", {})
+                self.browser.execute_cdp_cmd(
+                    "Network.setBlockedURLs",
+                    {"urls": self.BLOCKED_URL_PATTERNS}
+                )
+
             self.wait = WebDriverWait(self.browser, 20)
+            self._close_http_session()
             self.logger.info("WebDriver initialized successfully.")
 
         except WebDriverException as e:
-            self.logger.critical(f"Fatal WebDriver Initialization Error: {e}")
+            self.logger.critical("Fatal WebDriver Initialization Error: %s", e)
             raise
 
     def _random_delay(self, low=2.0, high=5.0):
-        """Adds randomized human-like delays to avoid bot detection."""
+        """
+        Adds randomized human-like delays to avoid bot detection. Readiness is
+        handled by explicit WebDriverWait conditions; this is only jitter.
+        """
         time.sleep(random.uniform(low, high))
 
+    def _trim_session(self):
+        """
+        Keeps a long-lived session lean by dropping Edge's HTTP cache. The
+        session itself is only rebuilt when it crashes, via _session_guard.
+        """
+        self.browser.execute_cdp_cmd("Network.clearBrowserCache", {})
+
     def _session_guard(self, func, *args, **kwargs):
         """
         Auto-retries function calls if WebDriver session crashes.
@@ -123,19 +286,19 @@ class JumiaRetailScraper:
             except (InvalidSessionIdException, WebDriverException) as e:
                 if attempt < max_retries:
                     self.logger.warning(
-                        f"Session crash detected ({e}). "
-                        f"Re-initializing (Attempt {attempt + 1})..."
+                        "Session crash detected (%s). Re-initializing (Attempt %d)...",
+                        e, attempt + 1
                     )
                     self._init_browser()
                     time.sleep(5)
                 else:
                     self.logger.error(
-                        f"Operation failed after {max_retries} retries: {e}"
+                        "Operation failed after %d retries: %s", max_retries, e
                     )
                     return None
 
             except Exception as e:
-                self.logger.error(f"Unexpected error: {e}")
+                self.logger.error("Unexpected error: %s", e)
                 traceback.print_exc()
                 return None
 
@@ -147,30 +310,193 @@ class JumiaRetailScraper:
         base = f"{str(user_name).strip().lower()}|{product_url.split('?')[0]}"
         return hashlib.md5(base.encode("utf-8")).hexdigest()[:12]
 
-    @staticmethod
-    def _extract_rating_int(raw_rating_text):
+    @classmethod
+    def _extract_rating_int(cls, raw_rating_text):
         """
         Convert strings like '5 out of 5' to 5.
         """
         if not raw_rating_text:
             return 0
 
-        match = re.search(r"(\d+)", str(raw_rating_text))
+        match = cls._RATING_RE.search(str(raw_rating_text))
         return int(match.group(1)) if match else 0
 
+    def _fetch_articles_html(self):
+        """
+        Reads only the review articles' markup straight from the DevTools
+        runtime instead of serializing the whole page through page_source.
+        """
+        response = self.browser.execute_cdp_cmd(
+            "Runtime.evaluate",
+            {"expression": self._ARTICLES_HTML_JS, "returnByValue": True}
+        )
+        return response.get("result", {}).get("value") or ""
+
+    @staticmethod
+    def _node_text(node):
+        """Equivalent of BeautifulSoup's get_text(strip=True)."""
+        return "".join(piece.strip() for piece in node.itertext())
+
+    def _first_text(self, xpath, node):
+        matches = xpath(node)
+        return self._node_text(matches[0]) if matches else ""
+
+    @classmethod
+    def _parse_html(cls, html):
+        return lxml.html.fromstring(html, parser=cls._HTML_PARSER) if html else None
+
+    def _parse_reviews(self, root, product_url, category, product_name):
+        """Turns parsed review article markup into review records."""
+        if root is None:
+            return []
+
+        records = []
+        for rev in self._XP_ARTICLES(root):
+            rating = self._extract_rating_int(self._first_text(self._XP_STARS, rev))
+            review_title = self._first_text(self._XP_TITLE, rev)
+            review_text = self._first_text(self._XP_TEXT, rev)
+
+            date_val, user_name = "N/A", "Anonymous"
+            meta_section = self._XP_META(rev)
+            if meta_section:
+                spans = self._XP_SPANS(meta_section[0])
+                if len(spans) >= 2:
+                    date_val = self._node_text(spans[0])
+                    user_name = self._node_text(spans[1]).replace("by ", "")
+                elif len(spans) == 1:
+                    date_val = self._node_text(spans[0])
+
+            verified = self._XP_VERIFIED(rev)
+            user_id = self._generate_user_id(user_name, product_url)
+
+            records.append(Review(
+                Category=category,
+                Product_Name=product_name,
+                Product_URL=product_url,
+                User_Name=user_name,
+                User_ID=user_id,
+                Rating=rating,
+                Review_Title=review_title,
+                Review_Text=review_text,
+                Timestamp=date_val,
+                Verified_Badge=verified
+            ))
+
+        return records
+
+    def _http_session(self):
+        """
+        HTTP session carrying the browser's user agent and cookies, backed by
+        an on-disk cache so restarts don't re-download pages seen that day.
+        """
+        if self._http is None:
+            os.makedirs("data", exist_ok=True)
+            # Every worker process shares this file: WAL lets readers run
+            # alongside a writer, and the busy timeout waits out the rest.
+            session = requests_cache.CachedSession(
+                cache_name="data/jumia_cache",
+                backend="sqlite",
+                expire_after=86400,
+                wal=True,
+                busy_timeout=30_000
+            )
+            session.headers.update({"User-Agent": self.user_agent})
+            for cookie in self.browser.get_cookies():
+                session.cookies.set(
+                    cookie["name"], cookie["value"], domain=cookie.get("domain")
+                )
+            self._http = session
+        return self._http
+
+    def _close_http_session(self):
+        if self._http is not None:
+            try:
+                self._http.close()
+            except Exception:
+                pass
+        self._http = None
+
+    def _product_page_over_http(self, product_url):
+        """
+        Reads the product name and See All reviews URL from the product page
+        through the cached session, so products already seen skip Edge
+        entirely. Returns None when either can't be found.
+        """
+        try:
+            response = self._http_session().get(product_url, timeout=20)
+            response.raise_for_status()
+            root = self._parse_html(response.text)
+        except self._HTTP_ERRORS + (etree.ParserError, ValueError) as e:
+            self.logger.warning("HTTP fetch failed for product page: %s", e)
+            return None
+
+        see_all = self._XP_SEE_ALL_HREF(root) if root is not None else []
+        if not see_all:
+            return None
+
+        return self._XP_PAGE_TITLE(root), urljoin(product_url, see_all[0])
+
+    def _fetch_reviews_over_http(self, reviews_url, product_url, category, product_name):
+        """
+        Jumia's review pages are server-rendered, so they can be walked with
+        plain GETs instead of rendering each one in Edge. Returns None when the
+        first page yields no reviews or the walk can't be completed, so the
+        caller falls back to the browser rather than keeping a partial list.
+        """
+        collected, previous_page = [], None
+        seen_urls = set()
+        url, page_num = reviews_url, 1
+
+        while url and url not in seen_urls:
+            if page_num > self.MAX_HTTP_REVIEW_PAGES:
+                self.logger.warning(
+                    "HTTP walk hit %d pages; handing product to the browser.",
+                    self.MAX_HTTP_REVIEW_PAGES
+                )
+                return None
+
+            seen_urls.add(url)
+            try:
+                response = self._http_session().get(url, timeout=20)
+                response.raise_for_status()
+            except self._HTTP_ERRORS as e:
+                self.logger.warning("HTTP fetch failed on page %d: %s", page_num, e)
+                return None
+
+            try:
+                root = self._parse_html(response.text)
+            except (etree.ParserError, ValueError) as e:
+                self.logger.warning("Unparseable review page %d over HTTP: %s", page_num, e)
+                return None
+
+            reviews = self._parse_reviews(root, product_url, category, product_name)
+            # Past the end, the hidden Next link can lead to the last page
+            # being served again.
+            if not reviews or reviews == previous_page:
+                break
+
+            previous_page = reviews
+            collected.extend(reviews)
+            self.logger.info("Page %d: Extracted %d reviews over HTTP.", page_num, len(reviews))
+
+            next_href = self._XP_NEXT_HREF(root)
+            url = urljoin(url, next_href[0]) if next_href else None
+            page_num += 1
+            if not response.from_cache:
+                self._random_delay(0.5, 1.5)
+
+        return collected or None
+
     def navigate_home_and_clear_popups(self):
         """Navigates to homepage and closes popups like cookies and newsletters."""
         def _inner():
             self.logger.info("Navigating to Jumia homepage...")
             self.browser.get("https://www.jumia.com.ng")
-            self._random_delay(3, 5)
+            self._random_delay(0.2, 0.6)
 
             try:
                 close_btn = self.wait.until(
-                    EC.element_to_be_clickable((
-                        By.XPATH,
-                        "//button[contains(@aria-label, 'close') or contains(@class, 'cls')]"
-                    ))
+                    EC.element_to_be_clickable(self._LOC_POPUP_CLOSE)
                 )
                 close_btn.click()
                 self.logger.info("Popup dismissed.")
@@ -179,10 +505,7 @@ class JumiaRetailScraper:
 
             try:
                 cookie_btn = self.wait.until(
-                    EC.element_to_be_clickable((
-                        By.XPATH,
-                        "//button[contains(text(), 'Accept') or @id='cookies-accept-all']"
-                    ))
+                    EC.element_to_be_clickable(self._LOC_COOKIE_ACCEPT)
                 )
                 cookie_btn.click()
                 self.logger.info("Cookies accepted.")
@@ -196,7 +519,7 @@ class JumiaRetailScraper:
         found_links = []
 
         def _inner():
-            self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "prd")))
+            self.wait.until(EC.presence_of_element_located(self._LOC_PRODUCT_CARD))
 
             links = self.browser.execute_script("""
                 var links = [];
@@ -205,7 +528,7 @@ class JumiaRetailScraper:
             """)
 
             found_links.extend(links)
-            self.logger.info(f"Found {len(links)} products in '{cat_name}'")
+            self.logger.info("Found %d products in '%s'", len(links), cat_name)
 
         self._session_guard(_inner)
         return found_links
@@ -214,181 +537,184 @@ class JumiaRetailScraper:
         """
         Main review extraction logic.
         Uses ARIA labels for pagination and preserves original robust flow.
+        Edge is only driven when the cached HTTP path can't serve the product.
+        Returns the product's reviews; persisting them is left to the caller.
         """
-        self.logger.info(f"[Processing] {product_url}")
+        self.logger.info("[Processing] %s", product_url)
 
         def _inner():
+            product_reviews = []
+
+            http_reviews_url = None
+            product_page = self._product_page_over_http(product_url)
+            if product_page:
+                product_name, http_reviews_url = product_page
+                http_reviews = self._fetch_reviews_over_http(
+                    http_reviews_url, product_url, category, product_name
+                )
+                if http_reviews is not None:
+                    return http_reviews
+
             self.browser.get(product_url)
-            self._random_delay(2, 4)
+            self._random_delay(0.2, 0.6)
 
             product_name = self.browser.title.strip() if self.browser.title else ""
 
             try:
                 see_all = self.wait.until(
-                    EC.element_to_be_clickable((By.PARTIAL_LINK_TEXT, "See All"))
+                    EC.element_to_be_clickable(self._LOC_SEE_ALL)
                 )
 
-                self.browser.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center'});",
-                    see_all
-                )
-                self._random_delay(1, 1.5)
+                reviews_url = see_all.get_attribute("href")
+                if reviews_url:
+                    if reviews_url != http_reviews_url:
+                        http_reviews = self._fetch_reviews_over_http(
+                            reviews_url, product_url, category, product_name
+                        )
+                        if http_reviews is not None:
+                            return http_reviews
 
-                try:
-                    see_all.click()
-                except ElementClickInterceptedException:
-                    self.browser.execute_script("arguments[0].click();", see_all)
+                    self.browser.get(reviews_url)
+                else:
+                    try:
+                        see_all.click()
+                    except ElementClickInterceptedException:
+                        self.browser.execute_script("arguments[0].click();", see_all)
 
             except TimeoutException:
                 self.logger.warning("No 'See All Reviews' link found. Skipping.")
-                return
+                return product_reviews
 
             page_num = 1
-            total_collected = 0
+            visited = {self.browser.current_url}
 
             while True:
                 try:
                     self.wait.until(
-                        EC.presence_of_all_elements_located((By.TAG_NAME, "article"))
+                        EC.presence_of_all_elements_located(self._LOC_ARTICLE)
                     )
 
-                    soup = BeautifulSoup(self.browser.page_source, "html.parser")
-                    reviews = soup.find_all("article")
+                    reviews = self._parse_reviews(
+                        self._parse_html(self._fetch_articles_html()),
+                        product_url,
+                        category,
+                        product_name
+                    )
 
                     if not reviews:
                         break
 
-                    for rev in reviews:
-                        rating = 0
-                        stars_div = rev.find("div", class_="stars")
-                        if stars_div:
-                            rating = self._extract_rating_int(
-                                stars_div.get_text(strip=True)
-                            )
-
-                        review_title = (
-                            rev.find("h3").get_text(strip=True)
-                            if rev.find("h3") else ""
-                        )
-
-                        review_text = (
-                            rev.find("p", class_="-pvs").get_text(strip=True)
-                            if rev.find("p", class_="-pvs") else ""
-                        )
-
-                        date_val, user_name = "N/A", "Anonymous"
-                        meta_section = rev.find("div", class_="-pvs")
-                        if meta_section:
-                            spans = meta_section.find_all("span")
-                            if len(spans) >= 2:
-                                date_val = spans[0].get_text(strip=True)
-                                user_name = spans[1].get_text(strip=True).replace("by ", "")
-                            elif len(spans) == 1:
-                                date_val = spans[0].get_text(strip=True)
-
-                        verified = "Verified Purchase" in rev.get_text()
-                        user_id = self._generate_user_id(user_name, product_url)
-
-                        self.results.append({
-                            "Category": category,
-                            "Product_Name": product_name,
-                            "Product_URL": product_url,
-                            "User_Name": user_name,
-                            "User_ID": user_id,
-                            "Rating": rating,
-                            "Review_Title": review_title,
-                            "Review_Text": review_text,
-                            "Timestamp": date_val,
-                            "Verified_Badge": verified
-                        })
-
-                        total_collected += 1
+                    product_reviews.extend(reviews)
 
                     self.logger.info(
-                        f"Page {page_num}: Extracted {len(reviews)} reviews."
+                        "Page %d: Extracted %d reviews.", page_num, len(reviews)
                     )
 
-                    if total_collected % 50 == 0:
-                        self._autosave(category, total_collected)
-
-                    try:
-                        old_elem = self.browser.find_elements(By.TAG_NAME, "article")
-
-                        next_btn = self.browser.find_element(
-                            By.CSS_SELECTOR,
-                            "a[aria-label='Next Page']"
-                        )
-
-                        if not next_btn.is_displayed():
-                            self.logger.info("Next button hidden. Pagination complete.")
-                            break
-
-                        self.browser.execute_script(
-                            "arguments[0].scrollIntoView({block: 'center'});",
-                            next_btn
-                        )
-                        self._random_delay(1, 2)
-                        self.browser.execute_script("arguments[0].click();", next_btn)
-
-                        try:
-                            if old_elem:
-                                self.wait.until(EC.staleness_of(old_elem[0]))
-                        except Exception:
-                            time.sleep(3)
-
-                        page_num += 1
-                        self._random_delay(2, 4)
-
-                    except NoSuchElementException:
-                        self.logger.info("No 'Next Page' button found. Pagination complete.")
+                    # Go straight to the ?page=N URL behind the Next link
+                    # rather than scrolling to it and clicking.
+                    next_url = self.browser.execute_script(self._NEXT_PAGE_HREF_JS)
+                    if not next_url or next_url in visited:
+                        self.logger.info("No 'Next Page' link found. Pagination complete.")
                         break
 
+                    visited.add(next_url)
+                    self.browser.get(next_url)
+                    self._random_delay(0.2, 0.6)
+                    page_num += 1
+
                 except StaleElementReferenceException:
                     self.logger.warning(
-                        f"Stale element on page {page_num}. Retrying loop..."
+                        "Stale element on page %d. Retrying loop...", page_num
                     )
                     continue
 
                 except Exception as e:
-                    self.logger.error(f"Error on page {page_num}: {e}")
+                    self.logger.error("Error on page %d: %s", page_num, e)
                     break
 
-            self._autosave(category, total_collected)
+            return product_reviews
 
-        self._session_guard(_inner)
+        return self._session_guard(_inner) or []
 
-    def _autosave(self, category, count):
-        """Safely saves only the current category to CSV."""
-        try:
+    def _get_writer(self, category):
+        """Opens (once) the append-mode CSV writer for a category."""
+        if category not in self._writers:
             os.makedirs("data/raw", exist_ok=True)
 
             filename = f"data/raw/jumia_reviews_{category.replace(' ', '_').lower()}.csv"
-            category_df = pd.DataFrame(
-                [row for row in self.results if row["Category"] == category]
-            )
+            write_header = not os.path.exists(filename) or os.path.getsize(filename) == 0
 
-            temp_filename = filename + ".tmp"
-            category_df.to_csv(temp_filename, index=False)
+            handle = open(filename, "a", newline="", encoding="utf-8")
+            writer = csv.writer(handle, quoting=csv.QUOTE_MINIMAL)
+            if write_header:
+                writer.writerow(self.FIELDNAMES)
 
-            if os.path.exists(filename):
-                os.remove(filename)
+            self._writers[category] = (handle, writer)
 
-            os.rename(temp_filename, filename)
-            self.logger.info(f"Autosaved {count} reviews to {filename}.")
+        return self._writers[category]
+
+    def _autosave(self, category, reviews):
+        """Streams a product's reviews to the category CSV and syncs it to disk."""
+        try:
+            handle, writer = self._get_writer(category)
+            writer.writerows(map(_review_row, reviews))
+
+            handle.flush()
+            os.fsync(handle.fileno())
+
+            self.logger.info("Autosaved %d reviews for '%s'.", len(reviews), category)
 
         except Exception as e:
-            self.logger.error(f"Save failed: {e}")
+            self.logger.error("Save failed: %s", e)
+
+    def _close_writers(self):
+        for handle, _ in self._writers.values():
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._writers = {}
 
     def shutdown(self):
-        """Gracefully quits the browser."""
+        """Gracefully quits the browser and closes open CSV files and the HTTP cache."""
+        self._close_writers()
+        self._close_http_session()
         if self.browser:
             self.browser.quit()
         self.logger.info("Scraper Shutdown Complete.")
 
 
+_worker_bot = None
+
+
+def _init_worker(driver_path, user_agent):
+    """
+    Process-pool initializer: every worker process owns one long-lived
+    scraper, reused across all the products it is handed.
+    """
+    global _worker_bot
+    _worker_bot = JumiaRetailScraper(driver_path, user_agent)
+    _worker_bot.navigate_home_and_clear_popups()
+
+    # multiprocessing runs these finalizers on worker exit for every start
+    # method, unlike atexit under fork.
+    Finalize(_worker_bot, _worker_bot.shutdown, exitpriority=10)
+
+
+def _scrape_product(product_url, category):
+    reviews = _worker_bot.extract_reviews(product_url, category)
+
+    _worker_bot.products_scraped += 1
+    if _worker_bot.products_scraped % 20 == 0:
+        _worker_bot._session_guard(_worker_bot._trim_session)
+
+    return reviews
+
+
 def run_scraper():
     path_to_driver = os.getenv("DRIVER")
     my_user_agent = os.getenv("AGENT")
+    max_workers = max(1, min(int(os.getenv("SCRAPER_WORKERS", "4")), os.cpu_count() or 1))
 
     target_categories = {
         "Mobile Phones": "https://www.jumia.com.ng/mobile-phones/",
@@ -397,30 +723,37 @@ def run_scraper():
     }
 
     while True:
+        jumia_bot = None
         try:
+            # The main-process session only browses category listings and
+            # owns the CSV writers; product pages go to the worker pool.
             jumia_bot = JumiaRetailScraper(path_to_driver, my_user_agent)
             jumia_bot.navigate_home_and_clear_popups()
 
-            for cat_name, cat_url in target_categories.items():
-                jumia_bot.logger.info(f"--- Scraping category: {cat_name} ---")
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(path_to_driver, my_user_agent)
+            ) as executor:
+                for cat_name, cat_url in target_categories.items():
+                    jumia_bot.logger.info("--- Scraping category: %s ---", cat_name)
 
-                jumia_bot._session_guard(jumia_bot.browser.get, cat_url)
-                product_links = jumia_bot.discover_products(cat_name)
+                    jumia_bot._session_guard(jumia_bot.browser.get, cat_url)
+                    product_links = jumia_bot.discover_products(cat_name)
 
-                for i, link in enumerate(product_links):
-                    jumia_bot.extract_reviews(link, cat_name)
+                    futures = [
+                        executor.submit(_scrape_product, link, cat_name)
+                        for link in product_links
+                    ]
 
-                    if i % 20 == 0 and i != 0:
-                        jumia_bot.logger.info(
-                            "Refreshing browser session for stability..."
-                        )
-                        jumia_bot._init_browser()
+                    for future in as_completed(futures):
+                        jumia_bot._autosave(cat_name, future.result())
 
             jumia_bot.shutdown()
             break
 
         except Exception as e:
-            logging.error(f"Fatal error, restarting scraper: {e}")
+            logging.error("Fatal error, restarting scraper: %s", e)
             traceback.print_exc()
 
             try:
@@ -429,7 +762,7 @@ def run_scraper():
                 pass
 
             delay = random.randint(60, 120)
-            logging.info(f"Restarting after {delay} seconds...")
+            logging.info("Restarting after %d seconds...", delay)
             time.sleep(delay)
 
 
@@ -4,6 +4,7 @@ import joblib
 import numpy as np
 import pandas as pd
 import torch
+import dotenv
 
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import (
@@ -20,11 +21,23 @@ from sklearn.preprocessing import StandardScaler
 
 from transformers import AutoTokenizer, AutoModel, pipeline
 
+dotenv.load_dotenv()
+
 
 class HybridReviewTrainer:
-    def __init__(self):
-        self.df = pd.read_csv("data/processed/trainable_reviews.csv")
+    def __init__(self, data_path: str = "data/processed/trainable_reviews.parquet"):
+        if data_path.endswith(".parquet"):
+            self.df = pd.read_parquet(data_path)
+        else:
+            self.df = pd.read_csv(data_path)
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        raw_batch_size = os.getenv("TRAIN_BATCH_SIZE", "32")
+        try:
+            self.batch_size = max(1, int(raw_batch_size))
+        except ValueError:
+            raise ValueError(
+                f"TRAIN_BATCH_SIZE must be a positive integer, got {raw_batch_size!r}"
+            ) from None
 
         self.behaviour_cols = [
             "Rating",
@@ -39,20 +52,45 @@ class HybridReviewTrainer:
 
     def load_afriberta(self):
         self.tokenizer = AutoTokenizer.from_pretrained("castorini/afriberta_large")
-        self.encoder = AutoModel.from_pretrained("castorini/afriberta_large")
+        self.encoder = AutoModel.from_pretrained(
+            "castorini/afriberta_large",
+            add_pooling_layer=False
+        )
         self.encoder.to(self.device)
         self.encoder.eval()
 
-    def sentiment_signal(self):
+    def sentiment_signal(self, batch_size: int | None = None):
+        batch_size = max(1, batch_size or self.batch_size)
         sentiment_pipeline = pipeline(
             "sentiment-analysis",
-            model="cardiffnlp/twitter-roberta-base-sentiment-latest"
+            model="cardiffnlp/twitter-roberta-base-sentiment-latest",
+            device=self.device
         )
 
+        texts = [text[:512] for text in self.df["Cleaned_Text"].fillna("").tolist()]
+
         scores = []
-        for text in self.df["Cleaned_Text"].fillna("").tolist():
+        fallback_rows = 0
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i:i + batch_size]
             try:
-                out = sentiment_pipeline(text[:512])[0]
+                outputs = sentiment_pipeline(batch, batch_size=batch_size, truncation=True)
+            except Exception:
+                # Re-score one by one so a single bad text doesn't zero out
+                # the whole batch.
+                outputs = []
+                for text in batch:
+                    try:
+                        outputs.append(sentiment_pipeline(text, truncation=True)[0])
+                    except Exception:
+                        outputs.append(None)
+                        fallback_rows += 1
+
+            for out in outputs:
+                if out is None:
+                    scores.append(0.0)
+                    continue
+
                 label = out["label"].lower()
                 score = float(out["score"])
 
@@ -62,8 +100,9 @@ class HybridReviewTrainer:
                     scores.append(score)
                 else:
                     scores.append(0.0)
-            except Exception:
-                scores.append(0.0)
+
+        if fallback_rows:
+            print(f"[WARN] Sentiment scoring failed for {fallback_rows} rows; scored as 0.0.")
 
         self.df["Text_Sentiment_Score"] = scores
 
@@ -73,13 +112,16 @@ class HybridReviewTrainer:
             self.df["Text_Sentiment_Score"] - self.df["Scaled_Rating"]
         )
 
-    def text_embeddings(self):
+    def text_embeddings(self, batch_size: int | None = None):
+        batch_size = max(1, batch_size or self.batch_size)
+        texts = self.df["Cleaned_Text"].fillna("").tolist()
         embeddings = []
 
         with torch.no_grad():
-            for text in self.df["Cleaned_Text"].fillna("").tolist():
+            for i in range(0, len(texts), batch_size):
+                batch = texts[i:i + batch_size]
                 encoded = self.tokenizer(
-                    text,
+                    batch,
                     padding=True,
                     truncation=True,
                     max_length=128,
@@ -88,9 +130,9 @@ class HybridReviewTrainer:
                 encoded = {k: v.to(self.device) for k, v in encoded.items()}
                 output = self.encoder(**encoded)
                 cls_vec = output.last_hidden_state[:, 0, :]
-                embeddings.append(cls_vec.cpu().numpy()[0])
+                embeddings.append(cls_vec.cpu().numpy())
 
-        return np.array(embeddings)
+        return np.vstack(embeddings)
 
     def prepare(self):
         self.load_afriberta()